@@ -9,6 +9,23 @@ function isDemoMode(credentials: AuthCredentials): boolean {
   return credentials.message === 'demo-mode';
 }
 
+// The site list for a wallet changes on the order of minutes, not per
+// request, so cache it briefly to skip the API round-trip on repeat calls
+const SITE_LIST_TTL_MS = 60 * 1000;
+
+const siteListCache = new Map<string, { sites: SiteInfo[]; fetchedAt: number }>();
+
+async function getCachedSitesWithNames(credentials: AuthCredentials): Promise<SiteInfo[]> {
+  const cached = siteListCache.get(credentials.walletAddress);
+  if (cached && Date.now() - cached.fetchedAt < SITE_LIST_TTL_MS) {
+    return cached.sites;
+  }
+
+  const sites = await sourcefulClient.getSitesWithNamesFromAPI(credentials);
+  siteListCache.set(credentials.walletAddress, { sites, fetchedAt: Date.now() });
+  return sites;
+}
+
 /**
  * Get sites for a wallet address
  */
@@ -18,7 +35,8 @@ export async function getSitesForWallet(
   if (isDemoMode(credentials)) {
     return DEMO_SITES.map(s => s.id);
   }
-  return sourcefulClient.getSitesFromAPI(credentials);
+  const sites = await getCachedSitesWithNames(credentials);
+  return sites.map(s => s.id);
 }
 
 /**
@@ -30,7 +48,7 @@ export async function getSitesWithNames(
   if (isDemoMode(credentials)) {
     return DEMO_SITES.map(s => ({ id: s.id, name: s.name }));
   }
-  return sourcefulClient.getSitesWithNamesFromAPI(credentials);
+  return getCachedSitesWithNames(credentials);
 }
 
 /**
@@ -46,6 +64,23 @@ export async function getSite(
   return sourcefulClient.getSiteFromAPI(siteId, credentials);
 }
 
+/**
+ * Get overviews for all of the wallet's sites in one batched request
+ * instead of one getSite call per site
+ */
+export async function getSitesOverview(
+  credentials: AuthCredentials
+): Promise<Record<string, SiteOverview>> {
+  if (isDemoMode(credentials)) {
+    const overviews: Record<string, SiteOverview> = {};
+    for (const site of DEMO_SITES) {
+      overviews[site.id] = getDemoSiteOverview(site.id);
+    }
+    return overviews;
+  }
+  return sourcefulClient.getSitesOverviewFromAPI(credentials);
+}
+
 /**
  * Get time series data
  */
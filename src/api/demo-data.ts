@@ -1,4 +1,4 @@
-import type { SiteOverview, TimeSeriesResponse, TimeSeriesPoint } from './types';
+import type { SiteOverview, TimeSeriesResponse } from './types';
 
 // Demo site configurations
 export const DEMO_SITES = [
@@ -187,7 +187,13 @@ export function getDemoTimeSeries(
   const isCommercial = siteId === 'demo-site-002';
   const prefix = siteId.replace('demo-site-', '');
   const now = new Date();
-  const data: TimeSeriesPoint[] = [];
+
+  // Columnar series: shared timestamps plus one value array per DER type
+  const timestamps: string[] = [];
+  const loadValues: number[] = [];
+  const pvValues: number[] = [];
+  const batteryValues: number[] = [];
+  const gridValues: number[] = [];
 
   // Parse time range
   let durationMs = 60 * 60 * 1000; // Default 1 hour
@@ -224,12 +230,11 @@ export function getDemoTimeSeries(
     soc += (battery / config.batteryCapacity) * (intervalMs / 3600000);
     soc = Math.max(0.1, Math.min(0.95, soc));
 
-    const timestamp = date.toISOString();
-
-    data.push({ timestamp, value: load, type: 'load', device_serial: 'load' });
-    data.push({ timestamp, value: solar, type: 'pv', device_serial: `pv-demo-${prefix}` });
-    data.push({ timestamp, value: battery, type: 'battery', device_serial: `bt-demo-${prefix}` });
-    data.push({ timestamp, value: grid, type: 'grid', device_serial: `em-demo-${prefix}` });
+    timestamps.push(date.toISOString());
+    loadValues.push(load);
+    pvValues.push(solar);
+    batteryValues.push(battery);
+    gridValues.push(grid);
   }
 
   return {
@@ -238,7 +243,12 @@ export function getDemoTimeSeries(
     field: 'W',
     start: new Date(startTime).toISOString(),
     aggregate: resolution,
-    data,
-    count: data.length,
+    series: [
+      { type: 'load', device_serial: 'load', timestamps, values: loadValues },
+      { type: 'pv', device_serial: `pv-demo-${prefix}`, timestamps, values: pvValues },
+      { type: 'battery', device_serial: `bt-demo-${prefix}`, timestamps, values: batteryValues },
+      { type: 'grid', device_serial: `em-demo-${prefix}`, timestamps, values: gridValues },
+    ],
+    count: timestamps.length * 4,
   };
 }
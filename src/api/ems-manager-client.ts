@@ -30,18 +30,33 @@ const MANAGER_API_BASE = '/ems/manager/api/v1';
 
 // ── Request helpers ───────────────────────────────────────────────────
 
+// Auth headers are derived from the credentials object, so cache the header
+// record per credentials instead of rebuilding it on every request
+const headerCache = new WeakMap<AuthCredentials, Record<string, string>>();
+
 function authHeaders(credentials: AuthCredentials): Record<string, string> {
-  return {
-    'x-auth-message': credentials.message,
-    'x-auth-signature': credentials.signature,
-    'Content-Type': 'application/json',
-  };
+  let headers = headerCache.get(credentials);
+  if (!headers) {
+    headers = {
+      'x-auth-message': credentials.message,
+      'x-auth-signature': credentials.signature,
+      'Content-Type': 'application/json',
+    };
+    headerCache.set(credentials, headers);
+  }
+  return headers;
 }
 
-async function managerGet<T>(endpoint: string, credentials: AuthCredentials): Promise<T> {
+async function managerFetch(
+  method: 'GET' | 'POST' | 'PUT' | 'PATCH' | 'DELETE',
+  endpoint: string,
+  credentials: AuthCredentials,
+  body?: unknown,
+): Promise<Response> {
   const response = await fetch(`${MANAGER_API_BASE}${endpoint}`, {
-    method: 'GET',
+    method,
     headers: authHeaders(credentials),
+    body: body !== undefined ? JSON.stringify(body) : undefined,
   });
 
   if (!response.ok) {
@@ -50,75 +65,67 @@ async function managerGet<T>(endpoint: string, credentials: AuthCredentials): Pr
     throw new Error(`EMS Manager API: ${response.status} ${response.statusText}`);
   }
 
+  return response;
+}
+
+async function managerGet<T>(endpoint: string, credentials: AuthCredentials): Promise<T> {
+  const response = await managerFetch('GET', endpoint, credentials);
   return response.json();
 }
 
 async function managerPost<T>(endpoint: string, credentials: AuthCredentials, body?: unknown): Promise<T> {
-  const response = await fetch(`${MANAGER_API_BASE}${endpoint}`, {
-    method: 'POST',
-    headers: authHeaders(credentials),
-    body: body ? JSON.stringify(body) : undefined,
-  });
-
-  if (!response.ok) {
-    const errorText = await response.text();
-    console.error('EMS Manager API error:', response.status, errorText);
-    throw new Error(`EMS Manager API: ${response.status} ${response.statusText}`);
-  }
-
+  const response = await managerFetch('POST', endpoint, credentials, body);
   return response.json();
 }
 
 async function managerPut<T>(endpoint: string, credentials: AuthCredentials, body: unknown): Promise<T> {
-  const response = await fetch(`${MANAGER_API_BASE}${endpoint}`, {
-    method: 'PUT',
-    headers: authHeaders(credentials),
-    body: JSON.stringify(body),
-  });
-
-  if (!response.ok) {
-    const errorText = await response.text();
-    console.error('EMS Manager API error:', response.status, errorText);
-    throw new Error(`EMS Manager API: ${response.status} ${response.statusText}`);
-  }
-
+  const response = await managerFetch('PUT', endpoint, credentials, body);
   return response.json();
 }
 
 async function managerPatch<T>(endpoint: string, credentials: AuthCredentials, body: unknown): Promise<T> {
-  const response = await fetch(`${MANAGER_API_BASE}${endpoint}`, {
-    method: 'PATCH',
-    headers: authHeaders(credentials),
-    body: JSON.stringify(body),
-  });
-
-  if (!response.ok) {
-    const errorText = await response.text();
-    console.error('EMS Manager API error:', response.status, errorText);
-    throw new Error(`EMS Manager API: ${response.status} ${response.statusText}`);
-  }
-
+  const response = await managerFetch('PATCH', endpoint, credentials, body);
   return response.json();
 }
 
 async function managerDelete(endpoint: string, credentials: AuthCredentials): Promise<void> {
-  const response = await fetch(`${MANAGER_API_BASE}${endpoint}`, {
-    method: 'DELETE',
-    headers: authHeaders(credentials),
-  });
-
-  if (!response.ok) {
-    const errorText = await response.text();
-    console.error('EMS Manager API error:', response.status, errorText);
-    throw new Error(`EMS Manager API: ${response.status} ${response.statusText}`);
-  }
+  await managerFetch('DELETE', endpoint, credentials);
 }
 
 // ── Sites ─────────────────────────────────────────────────────────────
 
-export async function getEMSSites(credentials: AuthCredentials): Promise<EMSSiteListItem[]> {
+// The wallet's EMS site list changes on the order of minutes, so cache it
+// briefly and index it by site id - per-site membership checks then hit the
+// index instead of refetching the whole list on every panel refresh
+const SITE_LIST_TTL_MS = 60 * 1000;
+
+interface SiteListCacheEntry {
+  sites: EMSSiteListItem[];
+  bySiteId: Map<string, EMSSiteListItem>;
+  fetchedAt: number;
+}
+
+const siteListCache = new WeakMap<AuthCredentials, SiteListCacheEntry>();
+
+async function getSiteIndex(credentials: AuthCredentials): Promise<SiteListCacheEntry> {
+  const cached = siteListCache.get(credentials);
+  if (cached && Date.now() - cached.fetchedAt < SITE_LIST_TTL_MS) {
+    return cached;
+  }
+
   const data = await managerGet<EMSSitesListResponse>('/sites', credentials);
-  return data.items;
+  const entry: SiteListCacheEntry = {
+    sites: data.items,
+    bySiteId: new Map(data.items.map(s => [s.site_id, s])),
+    fetchedAt: Date.now(),
+  };
+  siteListCache.set(credentials, entry);
+  return entry;
+}
+
+export async function getEMSSites(credentials: AuthCredentials): Promise<EMSSiteListItem[]> {
+  const index = await getSiteIndex(credentials);
+  return index.sites;
 }
 
 export async function getEMSSiteDetail(siteId: string, credentials: AuthCredentials): Promise<EMSSiteDetail> {
@@ -127,8 +134,8 @@ export async function getEMSSiteDetail(siteId: string, credentials: AuthCredenti
 
 export async function checkSiteHasEMS(siteId: string, credentials: AuthCredentials): Promise<EMSSiteListItem | null> {
   try {
-    const sites = await getEMSSites(credentials);
-    return sites.find(s => s.site_id === siteId) || null;
+    const index = await getSiteIndex(credentials);
+    return index.bySiteId.get(siteId) || null;
   } catch (e) {
     console.warn('Failed to check EMS status for site:', e);
     return null;
@@ -293,11 +300,14 @@ function parseCompactSchedule(envelope: EMSScheduleEnvelope): EMSParsedSchedule
 
   const slots: EMSParsedSlot[] = [];
 
+  // The DER group is shared by all slots - enumerate it once, not per slot
+  const derEntries = Object.entries(sch.dg);
+
   for (let i = 0; i < sch.n; i++) {
     const timestamp = new Date(startTime.getTime() + i * slotDuration * 1000);
 
     const ders: Record<string, { power: number; soc: number; weight: number }> = {};
-    for (const [derId, derData] of Object.entries(sch.dg)) {
+    for (const [derId, derData] of derEntries) {
       ders[derId] = {
         power: derData.p[i],
         soc: derData.soc[i],
@@ -342,14 +352,15 @@ export async function getEMSSchedule(
 }
 
 export function getCurrentSlot(schedule: EMSParsedSchedule): EMSParsedSlot | null {
-  const now = new Date();
-  for (const slot of schedule.slots) {
-    const slotEnd = new Date(slot.timestamp.getTime() + schedule.slotDuration * 1000);
-    if (now >= slot.timestamp && now < slotEnd) {
-      return slot;
-    }
-  }
-  return null;
+  if (schedule.slots.length === 0) return null;
+
+  // Slots are contiguous and fixed-length, so the current one can be indexed
+  // directly instead of scanning and allocating a slot-end Date per slot
+  const offsetMs = Date.now() - schedule.slots[0].timestamp.getTime();
+  if (offsetMs < 0) return null;
+
+  const index = Math.floor(offsetMs / (schedule.slotDuration * 1000));
+  return index < schedule.slots.length ? schedule.slots[index] : null;
 }
 
 // ── Mode helpers ──────────────────────────────────────────────────────
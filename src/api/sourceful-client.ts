@@ -1,5 +1,5 @@
 import type { AuthCredentials } from './sourceful-auth';
-import type { SiteOverview, TimeSeriesResponse, DER } from './types';
+import type { SiteOverview, TimeSeriesResponse, TimeSeriesSeries, DER } from './types';
 
 const API_BASE = 'https://api-vnext.srcful.dev/';
 
@@ -8,13 +8,21 @@ interface GraphQLResponse<T> {
   errors?: Array<{ message: string }>;
 }
 
+// Verbose request/response logging is useful in dev but serializing every
+// payload to the console is pure overhead on each production poll
+function debugLog(...args: unknown[]) {
+  if (import.meta.env.DEV) {
+    console.log(...args);
+  }
+}
+
 /**
  * Execute a GraphQL query against the Sourceful API
  */
 async function graphqlQuery<T>(
   query: string,
-  variables?: Record<string, unknown>,
-  credentials?: AuthCredentials | null
+  credentials?: AuthCredentials | null,
+  options: { allowPartial?: boolean } = {}
 ): Promise<T> {
   const headers: Record<string, string> = {
     'Content-Type': 'application/json',
@@ -25,11 +33,12 @@ async function graphqlQuery<T>(
     headers['x-auth-signature'] = credentials.signature;
   }
 
-  const body = JSON.stringify({ query, variables });
-  console.log('📡 GraphQL request:', {
+  // The API doesn't support GraphQL variables (values are inlined into the
+  // document), so the payload is just the query - no dead fields to encode
+  const body = JSON.stringify({ query });
+  debugLog('📡 GraphQL request:', {
     url: API_BASE,
     hasCredentials: !!credentials,
-    variables,
     body: body.substring(0, 500)
   });
 
@@ -46,11 +55,18 @@ async function graphqlQuery<T>(
   }
 
   const result: GraphQLResponse<T> = await response.json();
-  console.log('📡 GraphQL response:', result);
+  debugLog('📡 GraphQL response:', result);
 
   if (result.errors && result.errors.length > 0) {
-    console.error('📡 GraphQL errors:', result.errors);
-    throw new Error(result.errors[0].message);
+    // Aliased batch documents can fail per field while the rest resolve.
+    // With allowPartial, keep whatever data came back (errored aliases are
+    // null) instead of discarding the whole payload for one bad field
+    if (options.allowPartial && result.data) {
+      console.warn('📡 GraphQL partial errors:', result.errors);
+    } else {
+      console.error('📡 GraphQL errors:', result.errors);
+      throw new Error(result.errors[0].message);
+    }
   }
 
   if (!result.data) {
@@ -133,6 +149,239 @@ interface TimeSeriesDataPoint {
   W: number | null;
 }
 
+// ============ DER classification ============
+
+interface DerInfo {
+  derSn: string;      // DER ID for API calls (pv-xxx, bt-xxx, etc.)
+  deviceSn: string;   // Actual device serial (rawSn)
+  isPrimary?: boolean; // For meters: is this the default energy meter?
+}
+
+type DersByType = Record<'pv' | 'battery' | 'charger' | 'meter', DerInfo[]>;
+
+// DER type is encoded in the derSn prefix
+const DER_TYPE_BY_PREFIX: Record<string, keyof DersByType> = {
+  'pv-': 'pv',
+  'bt-': 'battery',
+  'ch-': 'charger',
+  'em-': 'meter',
+};
+
+/**
+ * Bucket a site's DERs by type in a single pass over the device tree
+ */
+function collectDersByType(site: SiteV2): DersByType {
+  const dersByType: DersByType = { pv: [], battery: [], charger: [], meter: [] };
+
+  for (const device of site.devices) {
+    for (const der of device.ders) {
+      const type = DER_TYPE_BY_PREFIX[der.derSn.toLowerCase().slice(0, 3)];
+      if (!type) continue;
+
+      const derInfo: DerInfo = { derSn: der.derSn, deviceSn: device.rawSn };
+
+      // Check settings for primary meter flag
+      const isPrimaryMeter = der.settings?.some(
+        s => s.key === 'DEFAULT_ENERGY_METER' && s.value === 'true'
+      );
+      if (isPrimaryMeter) {
+        derInfo.isPrimary = true;
+      }
+
+      dersByType[type].push(derInfo);
+    }
+  }
+
+  return dersByType;
+}
+
+type LatestEnvelope = {
+  latest: LatestPvData | LatestBatteryData | LatestMeterData | LatestLoadData | null;
+} | null;
+
+/**
+ * Build aliased latest-reading selections for every DER of a site. The
+ * prefix keeps aliases unique when selections for several sites share one
+ * query document.
+ */
+function buildLatestSelections(dersByType: DersByType, prefix: string): string[] {
+  const selections: string[] = [];
+
+  dersByType.pv.forEach((pvInfo, i) => {
+    selections.push(`${prefix}pv${i}: pv(sn: "${pvInfo.derSn}") {
+      latest {
+        timestamp
+        W
+        mppt1_V
+        mppt1_A
+        mppt2_V
+        mppt2_A
+        heatsink_C
+        total_generation_Wh
+      }
+    }`);
+  });
+
+  dersByType.battery.forEach((batInfo, i) => {
+    selections.push(`${prefix}battery${i}: battery(sn: "${batInfo.derSn}") {
+      latest {
+        timestamp
+        W
+        A
+        V
+        SoC_nom_fract
+        heatsink_C
+        total_charge_Wh
+        total_discharge_Wh
+      }
+    }`);
+  });
+
+  dersByType.meter.forEach((meterInfo, i) => {
+    selections.push(`${prefix}meter${i}: meter(sn: "${meterInfo.derSn}") {
+      latest {
+        timestamp
+        W
+        Hz
+        L1_V
+        L1_A
+        L1_W
+        L2_V
+        L2_A
+        L2_W
+        L3_V
+        L3_A
+        L3_W
+        total_import_Wh
+        total_export_Wh
+      }
+    }`);
+  });
+
+  return selections;
+}
+
+/**
+ * Aggregate a site's latest DER readings (looked up by alias) into a
+ * SiteOverview
+ */
+function aggregateSiteOverview(
+  siteId: string,
+  dersByType: DersByType,
+  latestByAlias: Record<string, LatestEnvelope>,
+  prefix: string,
+  loadPower: number
+): SiteOverview {
+  // Aggregate PV data
+  let totalPvPower = 0;
+  const pvDers: DER[] = [];
+
+  dersByType.pv.forEach((pvInfo, i) => {
+    const pv = latestByAlias[`${prefix}pv${i}`]?.latest as LatestPvData | null | undefined;
+    if (pv) {
+      totalPvPower += pv.W || 0;
+      pvDers.push({
+        type: 'pv',
+        device_serial: pvInfo.deviceSn,
+        make: '',
+        power_w: pv.W || 0,
+        data: {
+          W: pv.W || 0,
+          mppt1_V: pv.mppt1_V || 0,
+          mppt1_A: pv.mppt1_A || 0,
+          mppt2_V: pv.mppt2_V || 0,
+          mppt2_A: pv.mppt2_A || 0,
+          heatsink_C: pv.heatsink_C || 0,
+          total_generation_Wh: pv.total_generation_Wh || 0,
+        },
+      });
+    }
+  });
+
+  // Aggregate Battery data
+  let totalBatteryPower = 0;
+  let batterySocSum = 0;
+  let batterySocCount = 0;
+  const batteryDers: DER[] = [];
+
+  dersByType.battery.forEach((batInfo, i) => {
+    const bat = latestByAlias[`${prefix}battery${i}`]?.latest as LatestBatteryData | null | undefined;
+    if (bat) {
+      totalBatteryPower += bat.W || 0;
+      if (bat.SoC_nom_fract !== null) {
+        batterySocSum += bat.SoC_nom_fract;
+        batterySocCount++;
+      }
+      batteryDers.push({
+        type: 'battery',
+        device_serial: batInfo.deviceSn,
+        make: '',
+        power_w: bat.W || 0,
+        data: {
+          W: bat.W || 0,
+          A: bat.A || 0,
+          V: bat.V || 0,
+          SoC_nom_fract: bat.SoC_nom_fract || 0,
+          heatsink_C: bat.heatsink_C || 0,
+          total_charge_Wh: bat.total_charge_Wh || 0,
+          total_discharge_Wh: bat.total_discharge_Wh || 0,
+        },
+      });
+    }
+  });
+
+  // Aggregate Meter data
+  let totalGridPower = 0;
+  const meterDers: DER[] = [];
+
+  dersByType.meter.forEach((meterInfo, i) => {
+    const meter = latestByAlias[`${prefix}meter${i}`]?.latest as LatestMeterData | null | undefined;
+    if (meter) {
+      // Only sum power from primary meter for total grid power
+      if (meterInfo.isPrimary) {
+        totalGridPower += meter.W || 0;
+      }
+      meterDers.push({
+        type: 'meter',
+        device_serial: meterInfo.deviceSn,
+        make: '',
+        power_w: meter.W || 0,
+        data: {
+          W: meter.W || 0,
+          Hz: meter.Hz || 0,
+          L1_V: meter.L1_V || 0,
+          L1_A: meter.L1_A || 0,
+          L1_W: meter.L1_W || 0,
+          L2_V: meter.L2_V || 0,
+          L2_A: meter.L2_A || 0,
+          L2_W: meter.L2_W || 0,
+          L3_V: meter.L3_V || 0,
+          L3_A: meter.L3_A || 0,
+          L3_W: meter.L3_W || 0,
+          total_import_Wh: meter.total_import_Wh || 0,
+          total_export_Wh: meter.total_export_Wh || 0,
+        },
+        isPrimary: meterInfo.isPrimary,
+      });
+    }
+  });
+
+  // Use meter power if available, otherwise calculate from load
+  const gridPower = totalGridPower !== 0 ? totalGridPower : (loadPower - totalPvPower - totalBatteryPower);
+
+  return {
+    site_id: siteId,
+    timestamp: new Date().toISOString(),
+    total_pv_power_w: totalPvPower,
+    total_battery_power_w: totalBatteryPower,
+    total_grid_power_w: gridPower,
+    total_ev_power_w: 0, // TODO: Add charger support
+    load_w: loadPower,
+    battery_soc_avg: batterySocCount > 0 ? batterySocSum / batterySocCount : null,
+    ders: [...pvDers, ...batteryDers, ...meterDers],
+  };
+}
+
 // ============ API Functions ============
 
 /**
@@ -151,33 +400,68 @@ export async function getSitesFromAPI(credentials: AuthCredentials): Promise<str
   return siteInfoList.map(s => s.id);
 }
 
-/**
- * Get all sites with their names for the authenticated wallet
- */
-export async function getSitesWithNamesFromAPI(credentials: AuthCredentials): Promise<SiteInfo[]> {
-  const query = `
-    query Sites {
-      sites {
-        list {
-          id
-          settings {
-            key
-            value
+// Settings keys that may carry a site's display name
+const NAME_SETTING_KEYS = new Set(['name', 'label', 'site_name']);
+
+// Static query documents, built once at module load
+const SITES_QUERY = `
+  query Sites {
+    sites {
+      list {
+        id
+        settings {
+          key
+          value
+        }
+      }
+    }
+  }
+`;
+
+const SITE_STRUCTURE_QUERY = `
+  query Site {
+    sites {
+      list {
+        id
+        devices {
+          rawSn
+          ders {
+            derSn
+            gwId
+            settings {
+              key
+              value
+            }
           }
         }
       }
     }
-  `;
+  }
+`;
+
+const SITE_DER_SERIALS_QUERY = `{
+  sites {
+    list {
+      id
+      devices {
+        rawSn
+        ders {
+          derSn
+        }
+      }
+    }
+  }
+}`;
 
-  const data = await graphqlQuery<{ sites: { list: SiteV2[] } }>(query, undefined, credentials);
+/**
+ * Get all sites with their names for the authenticated wallet
+ */
+export async function getSitesWithNamesFromAPI(credentials: AuthCredentials): Promise<SiteInfo[]> {
+  const data = await graphqlQuery<{ sites: { list: SiteV2[] } }>(SITES_QUERY, credentials);
 
   return data.sites.list.map(site => {
     // Look for name in settings (common keys: name, label, site_name)
-    const nameSetting = site.settings?.find(s =>
-      s.key.toLowerCase() === 'name' ||
-      s.key.toLowerCase() === 'label' ||
-      s.key.toLowerCase() === 'site_name'
-    );
+    const nameSetting = site.settings?.find(s => NAME_SETTING_KEYS.has(s.key.toLowerCase()));
     return {
       id: site.id,
       name: nameSetting?.value || null
@@ -189,31 +473,42 @@ export async function getSitesWithNamesFromAPI(credentials: AuthCredentials): Pr
  * Get site overview with all DER data
  */
 export async function getSiteFromAPI(siteId: string, credentials: AuthCredentials): Promise<SiteOverview> {
-  // First get the site structure
-  const siteQuery = `
-    query Site {
-      sites {
-        list {
-          id
-          devices {
-            rawSn
-            ders {
-              derSn
-              gwId
-              settings {
-                key
-                value
-              }
-            }
+  // Get load data (meter might not be available for all sites)
+  // Note: This API doesn't support GraphQL variables, so we inline values
+  const fetchLoadPower = async (): Promise<number> => {
+    const loadQuery = `{
+      data {
+        load(siteId: "${siteId}") {
+          latest {
+            timestamp
+            W
           }
         }
       }
+    }`;
+
+    try {
+      const loadData = await graphqlQuery<{
+        data: {
+          load: { latest: LatestLoadData | null };
+        };
+      }>(loadQuery, credentials);
+      const loadPower = loadData.data.load?.latest?.W || 0;
+      debugLog('📡 Load power:', loadPower);
+      return loadPower;
+    } catch (e) {
+      console.warn('Failed to fetch load data:', e);
+      return 0;
     }
-  `;
+  };
 
-  console.log('📡 Fetching site structure for:', siteId);
-  const siteData = await graphqlQuery<{ sites: { list: SiteV2[] } }>(siteQuery, undefined, credentials);
-  console.log('📡 Sites response:', siteData);
+  // The load query doesn't depend on the site structure, so run both
+  // round-trips concurrently
+  debugLog('📡 Fetching site structure and load for:', siteId);
+  const [siteData, loadPower] = await Promise.all([
+    graphqlQuery<{ sites: { list: SiteV2[] } }>(SITE_STRUCTURE_QUERY, credentials),
+    fetchLoadPower(),
+  ]);
 
   const site = siteData.sites.list.find(s => s.id === siteId);
 
@@ -221,282 +516,110 @@ export async function getSiteFromAPI(siteId: string, credentials: AuthCredential
     throw new Error(`Site ${siteId} not found`);
   }
 
-  console.log('📡 Found site:', site.id, 'with', site.devices.length, 'devices');
-
-  // Get load data first (meter might not be available for all sites)
-  // Note: This API doesn't support GraphQL variables, so we inline values
-  const loadQuery = `{
-    data {
-      load(siteId: "${siteId}") {
-        latest {
-          timestamp
-          W
-        }
-      }
-    }
-  }`;
-
-  console.log('📡 Fetching load data for site:', siteId);
-
-  let loadPower = 0;
-
-  try {
-    const loadData = await graphqlQuery<{
-      data: {
-        load: { latest: LatestLoadData | null };
-      };
-    }>(loadQuery, undefined, credentials);
-    loadPower = loadData.data.load?.latest?.W || 0;
-    console.log('📡 Load power:', loadPower);
-  } catch (e) {
-    console.warn('Failed to fetch load data:', e);
-  }
+  debugLog('📡 Found site:', site.id, 'with', site.devices.length, 'devices');
 
   // Try to get meter data if we have a meter serial number
   // For now, we'll skip meter data and calculate from DER values
 
   // Collect DERs with their device serial numbers
-  interface DerInfo {
-    derSn: string;      // DER ID for API calls (pv-xxx, bt-xxx, etc.)
-    deviceSn: string;   // Actual device serial (rawSn)
-    isPrimary?: boolean; // For meters: is this the default energy meter?
-  }
-
-  const dersByType: Record<string, DerInfo[]> = {
-    pv: [],
-    battery: [],
-    charger: [],
-    meter: [],
-  };
+  const dersByType = collectDersByType(site);
 
-  for (const device of site.devices) {
-    console.log('📡 Device:', device.rawSn, 'has', device.ders.length, 'DERs');
-    for (const der of device.ders) {
-      // Determine type from derSn prefix
-      const derSn = der.derSn.toLowerCase();
-      const derInfo: DerInfo = { derSn: der.derSn, deviceSn: device.rawSn };
+  debugLog('📡 Found DERs:', dersByType);
 
-      // Check settings for primary meter flag
-      const isPrimaryMeter = der.settings?.some(
-        s => s.key === 'DEFAULT_ENERGY_METER' && s.value === 'true'
-      );
-      if (isPrimaryMeter) {
-        derInfo.isPrimary = true;
-      }
-
-      console.log('📡 DER:', der.derSn, '-> device:', device.rawSn, isPrimaryMeter ? '(primary)' : '');
-
-      if (derSn.startsWith('pv-')) {
-        dersByType.pv.push(derInfo);
-      } else if (derSn.startsWith('bt-')) {
-        dersByType.battery.push(derInfo);
-      } else if (derSn.startsWith('ch-')) {
-        dersByType.charger.push(derInfo);
-      } else if (derSn.startsWith('em-')) {
-        dersByType.meter.push(derInfo);
-      }
-    }
-  }
+  // Fetch the latest reading for all DERs in a single aliased query instead
+  // of one round-trip per DER
+  // Note: This API doesn't support GraphQL variables, so we inline values
+  const latestSelections = buildLatestSelections(dersByType, '');
 
-  console.log('📡 Found DERs:', dersByType);
+  let latestByAlias: Record<string, LatestEnvelope> = {};
 
-  // Fetch PV data
-  let totalPvPower = 0;
-  const pvDers: DER[] = [];
-
-  for (const pvInfo of dersByType.pv) {
+  if (latestSelections.length > 0) {
     try {
-      // Note: This API doesn't support GraphQL variables, so we inline values
-      const pvQuery = `{
+      const latestQuery = `{
         data {
-          pv(sn: "${pvInfo.derSn}") {
-            latest {
-              timestamp
-              W
-              mppt1_V
-              mppt1_A
-              mppt2_V
-              mppt2_A
-              heatsink_C
-              total_generation_Wh
-            }
-          }
+          ${latestSelections.join('\n')}
         }
       }`;
-      console.log('📡 Fetching PV data for:', pvInfo.derSn, 'device:', pvInfo.deviceSn);
-      const pvData = await graphqlQuery<{ data: { pv: { latest: LatestPvData | null } } }>(
-        pvQuery,
-        undefined,
-        credentials
+      debugLog('📡 Fetching latest data for', latestSelections.length, 'DERs in one query');
+      // allowPartial: one failing DER alias (e.g. a decommissioned device)
+      // must not blank every other DER in the overview
+      const latestData = await graphqlQuery<{ data: Record<string, LatestEnvelope> }>(
+        latestQuery,
+        credentials,
+        { allowPartial: true }
       );
-
-      if (pvData.data.pv?.latest) {
-        const pv = pvData.data.pv.latest;
-        totalPvPower += pv.W || 0;
-        pvDers.push({
-          type: 'pv',
-          device_serial: pvInfo.deviceSn,
-          make: '',
-          power_w: pv.W || 0,
-          data: {
-            W: pv.W || 0,
-            mppt1_V: pv.mppt1_V || 0,
-            mppt1_A: pv.mppt1_A || 0,
-            mppt2_V: pv.mppt2_V || 0,
-            mppt2_A: pv.mppt2_A || 0,
-            heatsink_C: pv.heatsink_C || 0,
-            total_generation_Wh: pv.total_generation_Wh || 0,
-          },
-        });
-      }
+      latestByAlias = latestData.data || {};
     } catch (e) {
-      console.warn(`Failed to fetch PV data for ${pvInfo.derSn}:`, e);
+      console.warn('Failed to fetch latest DER data:', e);
     }
   }
 
-  // Fetch Battery data
-  let totalBatteryPower = 0;
-  let batterySocSum = 0;
-  let batterySocCount = 0;
-  const batteryDers: DER[] = [];
-
-  for (const batInfo of dersByType.battery) {
-    try {
-      // Note: This API doesn't support GraphQL variables, so we inline values
-      const batQuery = `{
-        data {
-          battery(sn: "${batInfo.derSn}") {
-            latest {
-              timestamp
-              W
-              A
-              V
-              SoC_nom_fract
-              heatsink_C
-              total_charge_Wh
-              total_discharge_Wh
-            }
-          }
-        }
-      }`;
-      console.log('📡 Fetching battery data for:', batInfo.derSn, 'device:', batInfo.deviceSn);
-      const batData = await graphqlQuery<{ data: { battery: { latest: LatestBatteryData | null } } }>(
-        batQuery,
-        undefined,
-        credentials
-      );
+  return aggregateSiteOverview(siteId, dersByType, latestByAlias, '', loadPower);
+}
 
-      if (batData.data.battery?.latest) {
-        const bat = batData.data.battery.latest;
-        totalBatteryPower += bat.W || 0;
-        if (bat.SoC_nom_fract !== null) {
-          batterySocSum += bat.SoC_nom_fract;
-          batterySocCount++;
-        }
-        batteryDers.push({
-          type: 'battery',
-          device_serial: batInfo.deviceSn,
-          make: '',
-          power_w: bat.W || 0,
-          data: {
-            W: bat.W || 0,
-            A: bat.A || 0,
-            V: bat.V || 0,
-            SoC_nom_fract: bat.SoC_nom_fract || 0,
-            heatsink_C: bat.heatsink_C || 0,
-            total_charge_Wh: bat.total_charge_Wh || 0,
-            total_discharge_Wh: bat.total_discharge_Wh || 0,
-          },
-        });
+/**
+ * Get overviews for every site of the wallet in a single round-trip per
+ * step: one query for all site structures, then one combined aliased query
+ * carrying the latest DER readings and load for every site. Avoids the
+ * N+1 pattern of calling getSiteFromAPI once per site.
+ */
+export async function getSitesOverviewFromAPI(
+  credentials: AuthCredentials
+): Promise<Record<string, SiteOverview>> {
+  const siteData = await graphqlQuery<{ sites: { list: SiteV2[] } }>(SITE_STRUCTURE_QUERY, credentials);
+  const sites = siteData.sites.list;
+  const dersBySite = sites.map(site => collectDersByType(site));
+
+  // Note: This API doesn't support GraphQL variables, so we inline values.
+  // Aliases are prefixed per site (s0_pv0, s1_battery2, ...) to keep them
+  // unique within the shared document
+  const selections: string[] = [];
+  sites.forEach((site, si) => {
+    selections.push(`s${si}_load: load(siteId: "${site.id}") {
+      latest {
+        timestamp
+        W
       }
-    } catch (e) {
-      console.warn(`Failed to fetch battery data for ${batInfo.derSn}:`, e);
-    }
-  }
+    }`);
+    selections.push(...buildLatestSelections(dersBySite[si], `s${si}_`));
+  });
 
-  // Fetch Meter data
-  let totalGridPower = 0;
-  const meterDers: DER[] = [];
+  let latestByAlias: Record<string, LatestEnvelope> = {};
 
-  for (const meterInfo of dersByType.meter) {
+  if (selections.length > 0) {
     try {
-      const meterQuery = `{
+      const bulkQuery = `{
         data {
-          meter(sn: "${meterInfo.derSn}") {
-            latest {
-              timestamp
-              W
-              Hz
-              L1_V
-              L1_A
-              L1_W
-              L2_V
-              L2_A
-              L2_W
-              L3_V
-              L3_A
-              L3_W
-              total_import_Wh
-              total_export_Wh
-            }
-          }
+          ${selections.join('\n')}
         }
       }`;
-      console.log('📡 Fetching meter data for:', meterInfo.derSn, 'device:', meterInfo.deviceSn, meterInfo.isPrimary ? '(primary)' : '');
-      const meterData = await graphqlQuery<{ data: { meter: { latest: LatestMeterData | null } } }>(
-        meterQuery,
-        undefined,
-        credentials
+      debugLog('📡 Fetching latest data for', sites.length, 'sites in one query');
+      // allowPartial: with every DER of every site in one document, a single
+      // errored alias must not collapse the whole fleet's overviews
+      const latestData = await graphqlQuery<{ data: Record<string, LatestEnvelope> }>(
+        bulkQuery,
+        credentials,
+        { allowPartial: true }
       );
-
-      if (meterData.data.meter?.latest) {
-        const meter = meterData.data.meter.latest;
-        // Only sum power from primary meter for total grid power
-        if (meterInfo.isPrimary) {
-          totalGridPower += meter.W || 0;
-        }
-        meterDers.push({
-          type: 'meter',
-          device_serial: meterInfo.deviceSn,
-          make: '',
-          power_w: meter.W || 0,
-          data: {
-            W: meter.W || 0,
-            Hz: meter.Hz || 0,
-            L1_V: meter.L1_V || 0,
-            L1_A: meter.L1_A || 0,
-            L1_W: meter.L1_W || 0,
-            L2_V: meter.L2_V || 0,
-            L2_A: meter.L2_A || 0,
-            L2_W: meter.L2_W || 0,
-            L3_V: meter.L3_V || 0,
-            L3_A: meter.L3_A || 0,
-            L3_W: meter.L3_W || 0,
-            total_import_Wh: meter.total_import_Wh || 0,
-            total_export_Wh: meter.total_export_Wh || 0,
-          },
-          isPrimary: meterInfo.isPrimary,
-        });
-      }
+      latestByAlias = latestData.data || {};
     } catch (e) {
-      console.warn(`Failed to fetch meter data for ${meterInfo.derSn}:`, e);
+      console.warn('Failed to fetch bulk latest data:', e);
     }
   }
 
-  // Use meter power if available, otherwise calculate from load
-  const gridPower = totalGridPower !== 0 ? totalGridPower : (loadPower - totalPvPower - totalBatteryPower);
+  const overviews: Record<string, SiteOverview> = {};
+  sites.forEach((site, si) => {
+    const load = latestByAlias[`s${si}_load`]?.latest as LatestLoadData | null | undefined;
+    overviews[site.id] = aggregateSiteOverview(
+      site.id,
+      dersBySite[si],
+      latestByAlias,
+      `s${si}_`,
+      load?.W || 0
+    );
+  });
 
-  return {
-    site_id: siteId,
-    timestamp: new Date().toISOString(),
-    total_pv_power_w: totalPvPower,
-    total_battery_power_w: totalBatteryPower,
-    total_grid_power_w: gridPower,
-    total_ev_power_w: 0, // TODO: Add charger support
-    load_w: loadPower,
-    battery_soc_avg: batterySocCount > 0 ? batterySocSum / batterySocCount : null,
-    ders: [...pvDers, ...batteryDers, ...meterDers],
-  };
+  return overviews;
 }
 
 /**
@@ -532,7 +655,7 @@ export async function getTimeSeriesFromAPI(
   const fromISO = fromDate.toISOString();
   const toISO = now.toISOString();
 
-  console.log('📡 Fetching time series for site:', siteId, 'from:', fromISO);
+  debugLog('📡 Fetching time series for site:', siteId, 'from:', fromISO);
 
   const result: TimeSeriesResponse = {
     site_id: siteId,
@@ -540,91 +663,55 @@ export async function getTimeSeriesFromAPI(
     field: 'W',
     start: fromISO,
     aggregate: resolution,
-    data: [],
+    series: [],
     count: 0,
   };
 
   // First, get DER serial numbers for this site
-  const siteQuery = `{
-    sites {
-      list {
-        id
-        devices {
-          rawSn
-          ders {
-            derSn
-          }
-        }
-      }
-    }
-  }`;
-
   let pvSerials: string[] = [];
   let batterySerials: string[] = [];
   let meterSerials: string[] = [];
 
   try {
-    const siteData = await graphqlQuery<{ sites: { list: SiteV2[] } }>(siteQuery, undefined, credentials);
+    const siteData = await graphqlQuery<{ sites: { list: SiteV2[] } }>(SITE_DER_SERIALS_QUERY, credentials);
     const site = siteData.sites.list.find(s => s.id === siteId);
     if (site) {
-      for (const device of site.devices) {
-        for (const der of device.ders) {
-          const derSn = der.derSn.toLowerCase();
-          if (derSn.startsWith('pv-')) {
-            pvSerials.push(der.derSn);
-          } else if (derSn.startsWith('bt-')) {
-            batterySerials.push(der.derSn);
-          } else if (derSn.startsWith('em-')) {
-            meterSerials.push(der.derSn);
-          }
-        }
-      }
+      const dersByType = collectDersByType(site);
+      pvSerials = dersByType.pv.map(d => d.derSn);
+      batterySerials = dersByType.battery.map(d => d.derSn);
+      meterSerials = dersByType.meter.map(d => d.derSn);
     }
-    console.log('📡 Found DERs for time series - PV:', pvSerials.length, 'Battery:', batterySerials.length, 'Meter:', meterSerials.length);
+    debugLog('📡 Found DERs for time series - PV:', pvSerials.length, 'Battery:', batterySerials.length, 'Meter:', meterSerials.length);
   } catch (e) {
     console.warn('Failed to fetch site DERs:', e);
   }
 
-  // Fetch load time series
-  try {
-    const loadQuery = `{
-      data {
-        load(siteId: "${siteId}") {
-          timeSeries(from: "${fromISO}", to: "${toISO}", resolution: "${resolution}") {
-            start
-            W
-          }
-        }
-      }
-    }`;
-
-    const data = await graphqlQuery<{
-      data: {
-        load: { timeSeries: TimeSeriesDataPoint[] | null };
-      };
-    }>(loadQuery, undefined, credentials);
-
-    if (data.data.load?.timeSeries) {
-      for (const point of data.data.load.timeSeries) {
-        result.data.push({
-          timestamp: point.start,
-          value: point.W || 0,
-          type: 'load',
-          device_serial: 'load',
-        });
-      }
-      console.log('📡 Load time series points:', data.data.load.timeSeries.length);
+  // Convert API points into one columnar series - parallel timestamp/value
+  // arrays instead of one tagged object per point
+  const toSeries = (
+    points: TimeSeriesDataPoint[],
+    type: string,
+    deviceSerial: string,
+  ): TimeSeriesSeries => {
+    const timestamps = new Array<string>(points.length);
+    const values = new Array<number>(points.length);
+    for (let i = 0; i < points.length; i++) {
+      timestamps[i] = points[i].start;
+      values[i] = points[i].W || 0;
     }
-  } catch (e) {
-    console.warn('Failed to fetch load time series:', e);
-  }
+    return { type, device_serial: deviceSerial, timestamps, values };
+  };
 
-  // Fetch PV time series for each inverter
-  for (const pvSn of pvSerials) {
+  // Fetch one series; failures degrade to a missing series
+  const fetchSeries = async (
+    entity: 'pv' | 'battery' | 'meter',
+    sn: string,
+    type: string,
+  ): Promise<TimeSeriesSeries | null> => {
     try {
-      const pvQuery = `{
+      const query = `{
         data {
-          pv(sn: "${pvSn}") {
+          ${entity}(sn: "${sn}") {
             timeSeries(from: "${fromISO}", to: "${toISO}", resolution: "${resolution}") {
               start
               W
@@ -634,69 +721,25 @@ export async function getTimeSeriesFromAPI(
       }`;
 
       const data = await graphqlQuery<{
-        data: {
-          pv: { timeSeries: TimeSeriesDataPoint[] | null };
-        };
-      }>(pvQuery, undefined, credentials);
-
-      if (data.data.pv?.timeSeries) {
-        for (const point of data.data.pv.timeSeries) {
-          result.data.push({
-            timestamp: point.start,
-            value: point.W || 0,
-            type: 'pv',
-            device_serial: pvSn,
-          });
-        }
-        console.log('📡 PV time series points for', pvSn, ':', data.data.pv.timeSeries.length);
-      }
-    } catch (e) {
-      console.warn(`Failed to fetch PV time series for ${pvSn}:`, e);
-    }
-  }
+        data: Record<string, { timeSeries: TimeSeriesDataPoint[] | null }>;
+      }>(query, credentials);
 
-  // Fetch battery time series for each battery
-  for (const batSn of batterySerials) {
-    try {
-      const batQuery = `{
-        data {
-          battery(sn: "${batSn}") {
-            timeSeries(from: "${fromISO}", to: "${toISO}", resolution: "${resolution}") {
-              start
-              W
-            }
-          }
-        }
-      }`;
+      const points = data.data[entity]?.timeSeries;
+      if (!points) return null;
 
-      const data = await graphqlQuery<{
-        data: {
-          battery: { timeSeries: TimeSeriesDataPoint[] | null };
-        };
-      }>(batQuery, undefined, credentials);
-
-      if (data.data.battery?.timeSeries) {
-        for (const point of data.data.battery.timeSeries) {
-          result.data.push({
-            timestamp: point.start,
-            value: point.W || 0,
-            type: 'battery',
-            device_serial: batSn,
-          });
-        }
-        console.log('📡 Battery time series points for', batSn, ':', data.data.battery.timeSeries.length);
-      }
+      debugLog(`📡 ${entity} time series points for`, sn, ':', points.length);
+      return toSeries(points, type, sn);
     } catch (e) {
-      console.warn(`Failed to fetch battery time series for ${batSn}:`, e);
+      console.warn(`Failed to fetch ${entity} time series for ${sn}:`, e);
+      return null;
     }
-  }
+  };
 
-  // Fetch meter (grid) time series
-  for (const meterSn of meterSerials) {
+  const fetchLoadSeries = async (): Promise<TimeSeriesSeries | null> => {
     try {
-      const meterQuery = `{
+      const loadQuery = `{
         data {
-          meter(sn: "${meterSn}") {
+          load(siteId: "${siteId}") {
             timeSeries(from: "${fromISO}", to: "${toISO}", resolution: "${resolution}") {
               start
               W
@@ -707,26 +750,35 @@ export async function getTimeSeriesFromAPI(
 
       const data = await graphqlQuery<{
         data: {
-          meter: { timeSeries: TimeSeriesDataPoint[] | null };
+          load: { timeSeries: TimeSeriesDataPoint[] | null };
         };
-      }>(meterQuery, undefined, credentials);
-
-      if (data.data.meter?.timeSeries) {
-        for (const point of data.data.meter.timeSeries) {
-          result.data.push({
-            timestamp: point.start,
-            value: point.W || 0,
-            type: 'grid',
-            device_serial: meterSn,
-          });
-        }
-        console.log('📡 Meter time series points for', meterSn, ':', data.data.meter.timeSeries.length);
-      }
+      }>(loadQuery, credentials);
+
+      const points = data.data.load?.timeSeries;
+      if (!points) return null;
+
+      debugLog('📡 Load time series points:', points.length);
+      return toSeries(points, 'load', 'load');
     } catch (e) {
-      console.warn(`Failed to fetch meter time series for ${meterSn}:`, e);
+      console.warn('Failed to fetch load time series:', e);
+      return null;
+    }
+  };
+
+  // Fire all series fetches concurrently instead of one round-trip at a time
+  const seriesLists = await Promise.all([
+    fetchLoadSeries(),
+    ...pvSerials.map(sn => fetchSeries('pv', sn, 'pv')),
+    ...batterySerials.map(sn => fetchSeries('battery', sn, 'battery')),
+    ...meterSerials.map(sn => fetchSeries('meter', sn, 'grid')),
+  ]);
+
+  for (const series of seriesLists) {
+    if (series) {
+      result.series.push(series);
+      result.count += series.timestamps.length;
     }
   }
 
-  result.count = result.data.length;
   return result;
 }
@@ -24,11 +24,11 @@ export interface SitesResponse {
   count: number;
 }
 
-export interface TimeSeriesPoint {
-  timestamp: string;
-  value: number;
-  type?: string;
-  device_serial?: string;
+export interface TimeSeriesSeries {
+  type: string;
+  device_serial: string;
+  timestamps: string[];  // ISO strings, in time order
+  values: number[];
 }
 
 export interface TimeSeriesResponse {
@@ -37,6 +37,6 @@ export interface TimeSeriesResponse {
   field: string;
   start: string;
   aggregate: string;
-  data: TimeSeriesPoint[];
+  series: TimeSeriesSeries[];
   count: number;
 }
@@ -170,33 +170,43 @@ function calculateTrend(data: SparklinePoint[]): { direction: 'up' | 'down' | 'f
 function generateSparklinePath(data: SparklinePoint[], width: number, height: number): { line: string; area: string } {
   if (!data || data.length < 2) return { line: '', area: '' };
 
-  const values = data.map(d => d.value);
-  const minVal = Math.min(...values);
-  const maxVal = Math.max(...values);
+  // Min/max in one loop - avoids an intermediate values array and the
+  // argument-spread limit of Math.min/max on long ranges
+  let minVal = data[0].value;
+  let maxVal = data[0].value;
+  for (let i = 1; i < data.length; i++) {
+    const v = data[i].value;
+    if (v < minVal) minVal = v;
+    if (v > maxVal) maxVal = v;
+  }
   const range = maxVal - minVal || 1;
 
   const padding = 4;
   const chartWidth = width - padding * 2;
   const chartHeight = height - padding * 2;
-
-  const points = data.map((d, i) => {
-    const x = padding + (i / (data.length - 1)) * chartWidth;
-    const y = padding + chartHeight - ((d.value - minVal) / range) * chartHeight;
-    return { x, y };
-  });
-
-  // Generate smooth curve using quadratic bezier
-  let linePath = `M ${points[0].x} ${points[0].y}`;
-  for (let i = 1; i < points.length; i++) {
-    const prev = points[i - 1];
-    const curr = points[i];
-    const cpX = (prev.x + curr.x) / 2;
-    linePath += ` Q ${prev.x} ${prev.y} ${cpX} ${(prev.y + curr.y) / 2}`;
+  const xStep = chartWidth / (data.length - 1);
+  const yScale = chartHeight / range;
+
+  // Generate smooth curve using quadratic bezier, building both paths in a
+  // single pass without materializing intermediate point objects
+  const startX = padding;
+  const startY = padding + chartHeight - (data[0].value - minVal) * yScale;
+  let linePath = `M ${startX} ${startY}`;
+  let prevX = startX;
+  let prevY = startY;
+
+  for (let i = 1; i < data.length; i++) {
+    const x = padding + i * xStep;
+    const y = padding + chartHeight - (data[i].value - minVal) * yScale;
+    const cpX = (prevX + x) / 2;
+    linePath += ` Q ${prevX} ${prevY} ${cpX} ${(prevY + y) / 2}`;
+    prevX = x;
+    prevY = y;
   }
-  linePath += ` L ${points[points.length - 1].x} ${points[points.length - 1].y}`;
+  linePath += ` L ${prevX} ${prevY}`;
 
   // Area path (line + bottom fill)
-  const areaPath = linePath + ` L ${points[points.length - 1].x} ${height} L ${points[0].x} ${height} Z`;
+  const areaPath = linePath + ` L ${prevX} ${height} L ${startX} ${height} Z`;
 
   return { line: linePath, area: areaPath };
 }
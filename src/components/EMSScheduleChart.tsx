@@ -48,6 +48,12 @@ export function EMSScheduleChart({ schedule, loading }: EMSScheduleChartProps) {
 
     const now = new Date();
 
+    // The set of DERs is the same in every slot - classify the ids once
+    // instead of prefix-testing each DER in each of the ~96 slots
+    const derIds = schedule.slots.length > 0 ? Object.keys(schedule.slots[0].ders) : [];
+    const batteryIds = derIds.filter(id => id.startsWith('bt-'));
+    const evIds = derIds.filter(id => id.startsWith('v2x-'));
+
     return schedule.slots.map((slot) => {
       const slotEnd = new Date(slot.timestamp.getTime() + schedule.slotDuration * 1000);
       const isCurrent = now >= slot.timestamp && now < slotEnd;
@@ -56,11 +62,16 @@ export function EMSScheduleChart({ schedule, loading }: EMSScheduleChartProps) {
       let evSoc: number | null = null;
       let batteryPower: number | null = null;
 
-      for (const [derId, derData] of Object.entries(slot.ders)) {
-        if (derId.startsWith('bt-')) {
+      for (const derId of batteryIds) {
+        const derData = slot.ders[derId];
+        if (derData) {
           batterySoc = derData.soc;
           batteryPower = derData.power;
-        } else if (derId.startsWith('v2x-')) {
+        }
+      }
+      for (const derId of evIds) {
+        const derData = slot.ders[derId];
+        if (derData) {
           evSoc = derData.soc;
         }
       }
@@ -1,9 +1,10 @@
-import { useEffect, useState, useCallback, useRef } from 'react';
+import { useEffect, useState, useCallback, useMemo, useRef } from 'react';
 import { motion } from 'framer-motion';
 import ReactECharts from 'echarts-for-react';
 import type { EChartsOption, XAXisComponentOption } from 'echarts';
 import { getTimeSeries } from '../api/data-service';
 import { useDataContext } from '../contexts/DataContext';
+import type { TimeSeriesSeries } from '../api/types';
 
 interface PowerChartProps {
   siteId: string;
@@ -11,24 +12,30 @@ interface PowerChartProps {
   refreshTrigger?: number; // Incremented to trigger incremental refresh
 }
 
+type SeriesKey = 'load' | 'pv' | 'battery' | 'grid';
+
+// Fixed shape: every bucket carries all four series slots so the engine can
+// share one hidden class across buckets instead of transitioning per
+// dynamically-added key
 interface ChartDataPoint {
   time: Date;
-  load?: number;
-  pv?: number;
-  battery?: number;
-  grid?: number;
-  [key: string]: Date | number | undefined;
+  load: number | undefined;
+  pv: number | undefined;
+  battery: number | undefined;
+  grid: number | undefined;
 }
 
+const SERIES_KEYS: SeriesKey[] = ['load', 'pv', 'battery', 'grid'];
+
 // Sourceful Design System Colors
-const COLORS = {
+const COLORS: Record<SeriesKey, string> = {
   load: '#94a3b8',      // --load (muted gray)
   pv: '#FFD500',        // --solar (yellow)
   battery: '#00FF84',   // --battery (neon green)
   grid: '#42A5F5',      // --grid (blue)
 };
 
-const LABELS: Record<string, string> = {
+const LABELS: Record<SeriesKey, string> = {
   load: 'Load',
   pv: 'Solar',
   battery: 'Battery',
@@ -63,22 +70,35 @@ export function PowerChart({ siteId, timeRange = '-1h', refreshTrigger }: PowerC
     return 60 * 60 * 1000;
   };
 
-  // Process response data into chart format
-  const processData = useCallback((responseData: Array<{ timestamp: string; type?: string; value: number }>) => {
+  // Process columnar response series into chart format
+  const processData = useCallback((seriesList: TimeSeriesSeries[]) => {
     const grouped: Record<string, ChartDataPoint> = {};
 
-    responseData.forEach((point) => {
-      const time = new Date(point.timestamp);
-      const key = time.toISOString();
-
-      if (!grouped[key]) {
-        grouped[key] = { time };
+    for (const series of seriesList) {
+      const derType = series.type as SeriesKey;
+      if (!(derType in COLORS)) continue;
+
+      const { timestamps, values } = series;
+
+      for (let i = 0; i < timestamps.length; i++) {
+        // API timestamps are already ISO strings, so they key buckets directly
+        // without allocating a Date + string per point
+        const key = timestamps[i];
+
+        let bucket = grouped[key];
+        if (!bucket) {
+          bucket = grouped[key] = {
+            time: new Date(key),
+            load: undefined,
+            pv: undefined,
+            battery: undefined,
+            grid: undefined,
+          };
+        }
+
+        bucket[derType] = (bucket[derType] || 0) + (values[i] || 0);
       }
-
-      const derType = point.type || 'unknown';
-      const current = (grouped[key][derType as keyof ChartDataPoint] as number) || 0;
-      (grouped[key] as Record<string, unknown>)[derType] = current + (point.value || 0);
-    });
+    }
 
     return Object.values(grouped).sort((a, b) => a.time.getTime() - b.time.getTime());
   }, []);
@@ -97,7 +117,7 @@ export function PowerChart({ siteId, timeRange = '-1h', refreshTrigger }: PowerC
 
     getTimeSeries(siteId, credentials, { start: timeRange, aggregate: resolution })
       .then((response) => {
-        const sortedData = processData(response.data);
+        const sortedData = processData(response.series);
         setData(sortedData);
         lastFetchRef.current = sortedData.length > 0 ? sortedData[sortedData.length - 1].time : new Date();
         isInitialLoadRef.current = false;
@@ -123,29 +143,56 @@ export function PowerChart({ siteId, timeRange = '-1h', refreshTrigger }: PowerC
 
     getTimeSeries(siteId, credentials, { start: incrementalRange, aggregate: resolution })
       .then((response) => {
-        const newPoints = processData(response.data);
+        const newPoints = processData(response.series);
 
         if (newPoints.length === 0) return;
 
         setData(prevData => {
-          // Merge new points with existing data
-          const existingTimes = new Set(prevData.map(d => d.time.getTime()));
-          const uniqueNewPoints = newPoints.filter(p => !existingTimes.has(p.time.getTime()));
-
-          if (uniqueNewPoints.length === 0) return prevData;
-
-          // Combine and sort
-          const combined = [...prevData, ...uniqueNewPoints].sort(
-            (a, b) => a.time.getTime() - b.time.getTime()
-          );
-
-          // Trim old data to keep within time window
+          // Both lists are already in time order, so merge them linearly -
+          // deduplicating and trimming to the window in the same pass -
+          // instead of building a Set, concatenating and re-sorting
           const cutoffTime = Date.now() - timeWindowMs;
-          const trimmed = combined.filter(d => d.time.getTime() >= cutoffTime);
-
-          lastFetchRef.current = trimmed.length > 0 ? trimmed[trimmed.length - 1].time : new Date();
-
-          return trimmed;
+          const merged: ChartDataPoint[] = [];
+          let changed = false;
+          let i = 0;
+          let j = 0;
+
+          while (i < prevData.length || j < newPoints.length) {
+            let next: ChartDataPoint;
+
+            if (i >= prevData.length) {
+              next = newPoints[j++];
+              changed = true;
+            } else if (j >= newPoints.length) {
+              next = prevData[i++];
+            } else {
+              const prevTime = prevData[i].time.getTime();
+              const newTime = newPoints[j].time.getTime();
+              if (prevTime < newTime) {
+                next = prevData[i++];
+              } else if (newTime < prevTime) {
+                next = newPoints[j++];
+                changed = true;
+              } else {
+                // Duplicate timestamp - keep the existing point
+                next = prevData[i++];
+                j++;
+              }
+            }
+
+            // Trim old data to keep within time window
+            if (next.time.getTime() >= cutoffTime) {
+              merged.push(next);
+            } else {
+              changed = true;
+            }
+          }
+
+          if (!changed) return prevData;
+
+          lastFetchRef.current = merged.length > 0 ? merged[merged.length - 1].time : new Date();
+
+          return merged;
         });
       })
       .catch((err) => {
@@ -164,6 +211,230 @@ export function PowerChart({ siteId, timeRange = '-1h', refreshTrigger }: PowerC
     }
   }, []);
 
+  // Build the chart option only when the data changes so the per-point
+  // series arrays are not re-materialized on every render
+  const option = useMemo((): EChartsOption => {
+    const seriesKeys = SERIES_KEYS.filter(key =>
+      data.some(d => d[key] !== undefined)
+    );
+
+    return {
+      backgroundColor: 'transparent',
+      animation: true,
+      animationDuration: 500,
+      animationDurationUpdate: 300,
+      animationEasing: 'cubicOut',
+      animationEasingUpdate: 'cubicOut',
+      tooltip: {
+        trigger: 'axis',
+        backgroundColor: 'rgba(17, 24, 39, 0.95)',
+        borderColor: 'rgba(55, 65, 81, 0.5)',
+        borderWidth: 1,
+        padding: [12, 16],
+        textStyle: {
+          color: '#E5E7EB',
+          fontSize: 12,
+        },
+        axisPointer: {
+          type: 'cross',
+          lineStyle: {
+            color: 'rgba(255, 255, 255, 0.2)',
+          },
+          crossStyle: {
+            color: 'rgba(255, 255, 255, 0.2)',
+          },
+        },
+        formatter: (params: unknown) => {
+          const arr = params as Array<{ seriesName: string; value: [Date, number]; color: string }>;
+          if (!arr.length) return '';
+          const time = new Date(arr[0].value[0]);
+          const pad = (n: number) => n.toString().padStart(2, '0');
+          const timeStr = `${pad(time.getHours())}:${pad(time.getMinutes())}`;
+          let html = `<div style="font-weight: 500; margin-bottom: 8px; color: #9CA3AF;">${timeStr}</div>`;
+          arr.forEach(item => {
+            const value = item.value[1];
+            const isKw = Math.abs(value) >= 1000;
+            const unit = isKw ? 'kW' : 'W';
+            const displayValue = isKw ? (value / 1000).toFixed(2) : value.toFixed(0);
+            html += `<div style="display: flex; align-items: center; gap: 8px; margin: 4px 0;">
+              <span style="width: 10px; height: 10px; border-radius: 50%; background: ${item.color}; box-shadow: 0 0 6px ${item.color};"></span>
+              <span>${item.seriesName}</span>
+              <span style="margin-left: auto; font-weight: 600;">${displayValue} ${unit}</span>
+            </div>`;
+          });
+          return html;
+        },
+      },
+      legend: {
+        data: seriesKeys.map(key => LABELS[key]),
+        top: 10,
+        right: 20,
+        textStyle: {
+          color: '#9CA3AF',
+          fontSize: 12,
+        },
+        itemWidth: 12,
+        itemHeight: 12,
+        icon: 'circle',
+      },
+      toolbox: {
+        feature: {
+          dataZoom: {
+            yAxisIndex: 'none',
+            title: {
+              zoom: 'Area Zoom',
+              back: 'Reset Zoom',
+            },
+          },
+          restore: {
+            title: 'Reset',
+          },
+        },
+        right: 20,
+        top: 10,
+        iconStyle: {
+          borderColor: '#6B7280',
+        },
+        emphasis: {
+          iconStyle: {
+            borderColor: '#00FF84', // Sourceful green
+          },
+        },
+      },
+      grid: {
+        left: 60,
+        right: 20,
+        top: 60,
+        bottom: 80,
+      },
+      xAxis: {
+        type: 'time',
+        axisLine: {
+          show: false,
+        },
+        axisTick: {
+          show: false,
+        },
+        axisLabel: {
+          color: '#6B7280',
+          fontSize: 11,
+          formatter: (value: number) => {
+            const date = new Date(value);
+            const pad = (n: number) => n.toString().padStart(2, '0');
+            return `${pad(date.getHours())}:${pad(date.getMinutes())}`;
+          },
+        },
+        splitLine: {
+          show: false,
+        },
+      } as XAXisComponentOption,
+      yAxis: {
+        type: 'value',
+        axisLine: {
+          show: false,
+        },
+        axisTick: {
+          show: false,
+        },
+        axisLabel: {
+          color: '#6B7280',
+          fontSize: 11,
+          formatter: (value: number) =>
+            Math.abs(value) >= 1000 ? `${(value / 1000).toFixed(1)}k` : value.toFixed(0),
+        },
+        splitLine: {
+          lineStyle: {
+            color: 'rgba(55, 65, 81, 0.5)',
+            type: 'dashed',
+          },
+        },
+      },
+      dataZoom: [
+        // Slider at the bottom
+        {
+          type: 'slider',
+          xAxisIndex: 0,
+          start: 0,
+          end: 100,
+          height: 30,
+          bottom: 10,
+          borderColor: 'rgba(55, 65, 81, 0.5)',
+          backgroundColor: 'rgba(31, 41, 55, 0.5)',
+          fillerColor: 'rgba(0, 255, 132, 0.15)', // Sourceful green
+          handleStyle: {
+            color: '#00FF84',
+            borderColor: '#00FF84',
+          },
+          moveHandleStyle: {
+            color: '#00FF84',
+          },
+          textStyle: {
+            color: '#9CA3AF',
+            fontSize: 10,
+          },
+          dataBackground: {
+            lineStyle: {
+              color: 'rgba(0, 255, 132, 0.5)',
+            },
+            areaStyle: {
+              color: 'rgba(0, 255, 132, 0.1)',
+            },
+          },
+          selectedDataBackground: {
+            lineStyle: {
+              color: '#00FF84',
+            },
+            areaStyle: {
+              color: 'rgba(0, 255, 132, 0.3)',
+            },
+          },
+          brushSelect: true,
+        },
+        // Inside zoom (mouse wheel + drag)
+        {
+          type: 'inside',
+          xAxisIndex: 0,
+          start: 0,
+          end: 100,
+          zoomOnMouseWheel: true,
+          moveOnMouseMove: true,
+          moveOnMouseWheel: false,
+        },
+      ],
+      series: seriesKeys.map(key => {
+        const color = COLORS[key];
+        return {
+          name: LABELS[key],
+          type: 'line' as const,
+          smooth: true,
+          symbol: 'none',
+          sampling: 'lttb' as const,
+          lineStyle: {
+            width: 2,
+            color,
+            shadowColor: color,
+            shadowBlur: 8,
+            shadowOffsetY: 4,
+          },
+          areaStyle: {
+            color: {
+              type: 'linear' as const,
+              x: 0,
+              y: 0,
+              x2: 0,
+              y2: 1,
+              colorStops: [
+                { offset: 0, color: `${color}40` },
+                { offset: 1, color: `${color}00` },
+              ],
+            },
+          },
+          data: data.map(d => [d.time, d[key] || 0]),
+        };
+      }),
+    };
+  }, [data]);
+
   if (loading) {
     return (
       <div className="bg-gray-800/30 rounded-2xl p-6 h-96 flex items-center justify-center border border-gray-700/30 backdrop-blur-xl">
@@ -194,222 +465,6 @@ export function PowerChart({ siteId, timeRange = '-1h', refreshTrigger }: PowerC
     );
   }
 
-  // Prepare series data
-  const seriesKeys = ['load', 'pv', 'battery', 'grid'].filter(key =>
-    data.some(d => d[key as keyof ChartDataPoint] !== undefined)
-  );
-
-  const option: EChartsOption = {
-    backgroundColor: 'transparent',
-    animation: true,
-    animationDuration: 500,
-    animationDurationUpdate: 300,
-    animationEasing: 'cubicOut',
-    animationEasingUpdate: 'cubicOut',
-    tooltip: {
-      trigger: 'axis',
-      backgroundColor: 'rgba(17, 24, 39, 0.95)',
-      borderColor: 'rgba(55, 65, 81, 0.5)',
-      borderWidth: 1,
-      padding: [12, 16],
-      textStyle: {
-        color: '#E5E7EB',
-        fontSize: 12,
-      },
-      axisPointer: {
-        type: 'cross',
-        lineStyle: {
-          color: 'rgba(255, 255, 255, 0.2)',
-        },
-        crossStyle: {
-          color: 'rgba(255, 255, 255, 0.2)',
-        },
-      },
-      formatter: (params: unknown) => {
-        const arr = params as Array<{ seriesName: string; value: [Date, number]; color: string }>;
-        if (!arr.length) return '';
-        const time = new Date(arr[0].value[0]);
-        const pad = (n: number) => n.toString().padStart(2, '0');
-        const timeStr = `${pad(time.getHours())}:${pad(time.getMinutes())}`;
-        let html = `<div style="font-weight: 500; margin-bottom: 8px; color: #9CA3AF;">${timeStr}</div>`;
-        arr.forEach(item => {
-          const value = item.value[1];
-          const unit = Math.abs(value) >= 1000 ? 'kW' : 'W';
-          const displayValue = Math.abs(value) >= 1000 ? (value / 1000).toFixed(2) : value.toFixed(0);
-          html += `<div style="display: flex; align-items: center; gap: 8px; margin: 4px 0;">
-            <span style="width: 10px; height: 10px; border-radius: 50%; background: ${item.color}; box-shadow: 0 0 6px ${item.color};"></span>
-            <span>${item.seriesName}</span>
-            <span style="margin-left: auto; font-weight: 600;">${displayValue} ${unit}</span>
-          </div>`;
-        });
-        return html;
-      },
-    },
-    legend: {
-      data: seriesKeys.map(key => LABELS[key]),
-      top: 10,
-      right: 20,
-      textStyle: {
-        color: '#9CA3AF',
-        fontSize: 12,
-      },
-      itemWidth: 12,
-      itemHeight: 12,
-      icon: 'circle',
-    },
-    toolbox: {
-      feature: {
-        dataZoom: {
-          yAxisIndex: 'none',
-          title: {
-            zoom: 'Area Zoom',
-            back: 'Reset Zoom',
-          },
-        },
-        restore: {
-          title: 'Reset',
-        },
-      },
-      right: 20,
-      top: 10,
-      iconStyle: {
-        borderColor: '#6B7280',
-      },
-      emphasis: {
-        iconStyle: {
-          borderColor: '#00FF84', // Sourceful green
-        },
-      },
-    },
-    grid: {
-      left: 60,
-      right: 20,
-      top: 60,
-      bottom: 80,
-    },
-    xAxis: {
-      type: 'time',
-      axisLine: {
-        show: false,
-      },
-      axisTick: {
-        show: false,
-      },
-      axisLabel: {
-        color: '#6B7280',
-        fontSize: 11,
-        formatter: (value: number) => {
-          const date = new Date(value);
-          const pad = (n: number) => n.toString().padStart(2, '0');
-          return `${pad(date.getHours())}:${pad(date.getMinutes())}`;
-        },
-      },
-      splitLine: {
-        show: false,
-      },
-    } as XAXisComponentOption,
-    yAxis: {
-      type: 'value',
-      axisLine: {
-        show: false,
-      },
-      axisTick: {
-        show: false,
-      },
-      axisLabel: {
-        color: '#6B7280',
-        fontSize: 11,
-        formatter: (value: number) =>
-          Math.abs(value) >= 1000 ? `${(value / 1000).toFixed(1)}k` : value.toFixed(0),
-      },
-      splitLine: {
-        lineStyle: {
-          color: 'rgba(55, 65, 81, 0.5)',
-          type: 'dashed',
-        },
-      },
-    },
-    dataZoom: [
-      // Slider at the bottom
-      {
-        type: 'slider',
-        xAxisIndex: 0,
-        start: 0,
-        end: 100,
-        height: 30,
-        bottom: 10,
-        borderColor: 'rgba(55, 65, 81, 0.5)',
-        backgroundColor: 'rgba(31, 41, 55, 0.5)',
-        fillerColor: 'rgba(0, 255, 132, 0.15)', // Sourceful green
-        handleStyle: {
-          color: '#00FF84',
-          borderColor: '#00FF84',
-        },
-        moveHandleStyle: {
-          color: '#00FF84',
-        },
-        textStyle: {
-          color: '#9CA3AF',
-          fontSize: 10,
-        },
-        dataBackground: {
-          lineStyle: {
-            color: 'rgba(0, 255, 132, 0.5)',
-          },
-          areaStyle: {
-            color: 'rgba(0, 255, 132, 0.1)',
-          },
-        },
-        selectedDataBackground: {
-          lineStyle: {
-            color: '#00FF84',
-          },
-          areaStyle: {
-            color: 'rgba(0, 255, 132, 0.3)',
-          },
-        },
-        brushSelect: true,
-      },
-      // Inside zoom (mouse wheel + drag)
-      {
-        type: 'inside',
-        xAxisIndex: 0,
-        start: 0,
-        end: 100,
-        zoomOnMouseWheel: true,
-        moveOnMouseMove: true,
-        moveOnMouseWheel: false,
-      },
-    ],
-    series: seriesKeys.map(key => ({
-      name: LABELS[key],
-      type: 'line',
-      smooth: true,
-      symbol: 'none',
-      sampling: 'lttb',
-      lineStyle: {
-        width: 2,
-        color: COLORS[key as keyof typeof COLORS],
-        shadowColor: COLORS[key as keyof typeof COLORS],
-        shadowBlur: 8,
-        shadowOffsetY: 4,
-      },
-      areaStyle: {
-        color: {
-          type: 'linear',
-          x: 0,
-          y: 0,
-          x2: 0,
-          y2: 1,
-          colorStops: [
-            { offset: 0, color: `${COLORS[key as keyof typeof COLORS]}40` },
-            { offset: 1, color: `${COLORS[key as keyof typeof COLORS]}00` },
-          ],
-        },
-      },
-      data: data.map(d => [d.time, d[key as keyof ChartDataPoint] || 0]),
-    })),
-  };
 
   return (
     <motion.div
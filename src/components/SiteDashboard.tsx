@@ -1,4 +1,4 @@
-import { useEffect, useState, useCallback, useMemo } from 'react';
+import { useEffect, useState, useCallback, useMemo, useRef } from 'react';
 import { motion } from 'framer-motion';
 import { RefreshCw } from 'lucide-react';
 import { getSite, getTimeSeries } from '../api/data-service';
@@ -55,6 +55,8 @@ export function SiteDashboard({ siteId }: SiteDashboardProps) {
     battery: [],
     grid: [],
   });
+  const siteFingerprintRef = useRef<string | null>(null);
+  const sparklineFingerprintRef = useRef<string | null>(null);
 
   const getResolution = (range: string): string => {
     if (range.includes('7d')) return '1h';
@@ -68,7 +70,14 @@ export function SiteDashboard({ siteId }: SiteDashboardProps) {
 
     try {
       const data = await getSite(siteId, credentials);
-      setSite(data);
+      // The overview timestamp changes on every poll even when nothing else
+      // does - fingerprint the rest and skip the state update (and the
+      // dashboard re-render it triggers) when the data is unchanged
+      const fingerprint = JSON.stringify({ ...data, timestamp: null });
+      if (fingerprint !== siteFingerprintRef.current) {
+        siteFingerprintRef.current = fingerprint;
+        setSite(data);
+      }
       setLastUpdate(new Date());
       setError(null);
     } catch (err) {
@@ -97,15 +106,17 @@ export function SiteDashboard({ siteId }: SiteDashboardProps) {
         grid: new Map(),
       };
 
-      response.data.forEach((point) => {
-        const timeKey = new Date(point.timestamp).toISOString();
-        const derType = point.type || 'unknown';
+      for (const series of response.series) {
+        const typeMap = grouped[series.type];
+        if (!typeMap) continue;
 
-        if (grouped[derType]) {
-          const current = grouped[derType].get(timeKey) || 0;
-          grouped[derType].set(timeKey, current + (point.value || 0));
+        const { timestamps, values } = series;
+        for (let i = 0; i < timestamps.length; i++) {
+          // API timestamps are already ISO strings - no need to re-derive the key
+          const current = typeMap.get(timestamps[i]) || 0;
+          typeMap.set(timestamps[i], current + (values[i] || 0));
         }
-      });
+      }
 
       // Convert to sparkline format
       const toSparkline = (map: Map<string, number>): SparklinePoint[] => {
@@ -114,12 +125,20 @@ export function SiteDashboard({ siteId }: SiteDashboardProps) {
           .sort((a, b) => a.time.getTime() - b.time.getTime());
       };
 
-      setSparklineData({
+      const next: SparklineData = {
         load: toSparkline(grouped.load),
         pv: toSparkline(grouped.pv),
         battery: toSparkline(grouped.battery),
         grid: toSparkline(grouped.grid),
-      });
+      };
+
+      // At coarse resolutions most polls return the same points - skip the
+      // state update (and the widget rebuild it triggers) when nothing changed
+      const fingerprint = JSON.stringify(next);
+      if (fingerprint !== sparklineFingerprintRef.current) {
+        sparklineFingerprintRef.current = fingerprint;
+        setSparklineData(next);
+      }
     } catch (err) {
       console.error('Failed to fetch sparkline data:', err);
     }
@@ -159,8 +178,11 @@ export function SiteDashboard({ siteId }: SiteDashboardProps) {
     );
   }, [site]);
 
-  // Build dashboard widgets
-  const dashboardWidgets = useMemo((): DashboardWidget[] => {
+  // Build dashboard widgets. The data-quality widget is kept out of this
+  // memo because lastUpdate changes on every poll - depending on it here
+  // would rebuild the whole widget tree each tick and defeat the
+  // fingerprint skips above
+  const mainWidgets = useMemo((): DashboardWidget[] => {
     if (!site) return [];
 
     // Determine grid color based on import/export
@@ -168,7 +190,7 @@ export function SiteDashboard({ siteId }: SiteDashboardProps) {
     const gridPrefix = site.total_grid_power_w > 0 ? 'Import' : site.total_grid_power_w < 0 ? 'Export' : '';
 
     // Determine battery color
-    const batteryColor = site.total_battery_power_w > 0 ? 'green' : site.total_battery_power_w < 0 ? 'purple' : 'purple';
+    const batteryColor = site.total_battery_power_w > 0 ? 'green' : 'purple';
     const batteryPrefix = site.total_battery_power_w > 0 ? '+' : '';
 
     const widgets: DashboardWidget[] = [
@@ -273,27 +295,32 @@ export function SiteDashboard({ siteId }: SiteDashboardProps) {
       });
     }
 
-    // Data Quality Stats
-    widgets.push({
-      id: 'data-quality',
-      title: 'Data Quality',
-      defaultLayout: { x: 0, y: 61, w: 12, h: 3, minH: 2, minW: 4 },
-      component: (
-        <div className="pt-2">
-          <DataQualityStats
-            lastUpdate={lastUpdate}
-            derCount={{
-              pv: categorizedDers?.pvs.length || 0,
-              battery: categorizedDers?.batteries.length || 0,
-              meter: categorizedDers?.meters.length || 0,
-            }}
-          />
-        </div>
-      ),
-    });
-
     return widgets;
-  }, [site, sparklineData, siteId, timeRange, isDemoMode, categorizedDers, lastUpdate]);
+  }, [site, sparklineData, siteId, timeRange, isDemoMode, categorizedDers]);
+
+  // Data Quality Stats - the only widget that reads lastUpdate
+  const dataQualityWidget = useMemo((): DashboardWidget => ({
+    id: 'data-quality',
+    title: 'Data Quality',
+    defaultLayout: { x: 0, y: 61, w: 12, h: 3, minH: 2, minW: 4 },
+    component: (
+      <div className="pt-2">
+        <DataQualityStats
+          lastUpdate={lastUpdate}
+          derCount={{
+            pv: categorizedDers?.pvs.length || 0,
+            battery: categorizedDers?.batteries.length || 0,
+            meter: categorizedDers?.meters.length || 0,
+          }}
+        />
+      </div>
+    ),
+  }), [categorizedDers, lastUpdate]);
+
+  const dashboardWidgets = useMemo(
+    (): DashboardWidget[] => (site ? [...mainWidgets, dataQualityWidget] : []),
+    [site, mainWidgets, dataQualityWidget]
+  );
 
   if (loading && !site) {
     return (
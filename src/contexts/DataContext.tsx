@@ -1,4 +1,4 @@
-import { createContext, useContext, useState, type ReactNode } from 'react';
+import { createContext, useContext, useState, useCallback, useMemo, type ReactNode } from 'react';
 import { useSourcefulAuth } from '../hooks/useSourcefulAuth';
 import type { AuthCredentials } from '../api/sourceful-auth';
 
@@ -17,6 +17,17 @@ interface DataContextType {
 
 const DataContext = createContext<DataContextType | undefined>(undefined);
 
+// Mock credentials for demo mode - one stable instance, so consumers (and
+// caches keyed on the credentials object) don't see a new identity on every
+// render
+const DEMO_CREDENTIALS: AuthCredentials = {
+  message: 'demo-mode',
+  signature: 'demo-signature',
+  walletAddress: 'demo-wallet',
+  issuedAt: new Date().toISOString(),
+  expiresAt: new Date(Date.now() + 365 * 24 * 60 * 60 * 1000).toISOString(),
+};
+
 export function useDataContext() {
   const context = useContext(DataContext);
   if (!context) {
@@ -45,38 +56,44 @@ export function DataProvider({ children }: DataProviderProps) {
     return saved === 'true';
   });
 
-  const handleSetDemoMode = (demo: boolean) => {
+  const handleSetDemoMode = useCallback((demo: boolean) => {
     setIsDemoMode(demo);
     localStorage.setItem('demo_mode', String(demo));
-  };
+  }, []);
 
   // In demo mode, we're always ready
   const needsCredentials = !isDemoMode && !hasCredentials && !isGenerating;
   const isReady = isDemoMode || hasCredentials;
 
-  // Create mock credentials for demo mode
-  const demoCredentials: AuthCredentials = {
-    message: 'demo-mode',
-    signature: 'demo-signature',
-    walletAddress: 'demo-wallet',
-    issuedAt: new Date().toISOString(),
-    expiresAt: new Date(Date.now() + 365 * 24 * 60 * 60 * 1000).toISOString(),
-  };
+  // Memoize the context value so consumers only re-render when something
+  // they read actually changed
+  const value = useMemo(
+    () => ({
+      credentials: isDemoMode ? DEMO_CREDENTIALS : credentials,
+      isReady,
+      isGeneratingCredentials: isGenerating,
+      credentialError: error,
+      generateCredentials,
+      clearCredentials: clearAuth,
+      needsCredentials,
+      isDemoMode,
+      setDemoMode: handleSetDemoMode,
+    }),
+    [
+      isDemoMode,
+      credentials,
+      isReady,
+      isGenerating,
+      error,
+      generateCredentials,
+      clearAuth,
+      needsCredentials,
+      handleSetDemoMode,
+    ]
+  );
 
   return (
-    <DataContext.Provider
-      value={{
-        credentials: isDemoMode ? demoCredentials : credentials,
-        isReady,
-        isGeneratingCredentials: isGenerating,
-        credentialError: error,
-        generateCredentials,
-        clearCredentials: clearAuth,
-        needsCredentials,
-        isDemoMode,
-        setDemoMode: handleSetDemoMode,
-      }}
-    >
+    <DataContext.Provider value={value}>
       {children}
     </DataContext.Provider>
   );